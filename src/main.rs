@@ -69,6 +69,8 @@ fn main() -> image::ImageResult<()> {
     println!("Total Pixels: {}", render_stat.pixels_rendered());
     println!("Time Taken: {:.3} seconds", render_stat.duration().as_secs_f64());
     println!("Average Pixel Rate: {:.2} px/s", render_stat.pixels_per_second());
+    println!("Average Sample Rate: {:.2} samples/s", render_stat.samples_per_second());
+    println!("Tile Pixel Rate: {:.2} ± {:.2} px/s over {} tiles", render_stat.tile_pixels_per_second_mean(), render_stat.tile_pixels_per_second_std_error(), render_stat.tiles_rendered());
 
     Ok(())
 }
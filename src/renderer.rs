@@ -12,12 +12,39 @@ pub struct RenderStat{
     duration: std::time::Duration,
     pixels_rendered: usize,
     pixels_per_second: f64,
+    samples_per_second: f64,
+    tiles_rendered: usize,
+    tile_pixels_per_second_mean: f64,
+    tile_pixels_per_second_std_error: f64,
 }
 
 impl RenderStat {
-    pub fn new(duration: std::time::Duration, pixels_rendered: usize) -> RenderStat {
+    pub fn new(duration: std::time::Duration, pixels_rendered: usize, samples_per_pixel: usize, tile_pixels_per_second: &[f64]) -> RenderStat {
         let pixels_per_second = (pixels_rendered as f64) / duration.as_secs_f64();
-        RenderStat { duration, pixels_rendered, pixels_per_second}
+        let samples_per_second = pixels_per_second * (samples_per_pixel as f64);
+
+        // each tile is an independent timing sample, so the spread across tiles
+        // gives a confidence interval for a single render
+        let tiles_rendered = tile_pixels_per_second.len();
+        let tile_pixels_per_second_mean = tile_pixels_per_second.iter().sum::<f64>() / (tiles_rendered.max(1) as f64);
+        let tile_pixels_per_second_std_error = if tiles_rendered > 1 {
+            let variance = tile_pixels_per_second.iter()
+                .map(|rate| (rate - tile_pixels_per_second_mean).powi(2))
+                .sum::<f64>() / ((tiles_rendered - 1) as f64);
+            (variance / (tiles_rendered as f64)).sqrt()
+        } else {
+            0.0
+        };
+
+        RenderStat {
+            duration,
+            pixels_rendered,
+            pixels_per_second,
+            samples_per_second,
+            tiles_rendered,
+            tile_pixels_per_second_mean,
+            tile_pixels_per_second_std_error,
+        }
     }
 
     pub fn duration(&self) -> std::time::Duration {
@@ -31,6 +58,22 @@ impl RenderStat {
     pub fn pixels_per_second(&self) -> f64 {
         self.pixels_per_second
     }
+
+    pub fn samples_per_second(&self) -> f64 {
+        self.samples_per_second
+    }
+
+    pub fn tiles_rendered(&self) -> usize {
+        self.tiles_rendered
+    }
+
+    pub fn tile_pixels_per_second_mean(&self) -> f64 {
+        self.tile_pixels_per_second_mean
+    }
+
+    pub fn tile_pixels_per_second_std_error(&self) -> f64 {
+        self.tile_pixels_per_second_std_error
+    }
 }
 
 
@@ -382,7 +425,12 @@ impl Renderer for TileRenderer {
 
                 results[block_index_x + block_index_y * width_in_blocks].output[intra_block_x + intra_block_y * self.block_size.get()]
             }),
-            RenderStat::new(duration, camera.image_height() * camera.image_width())
+            RenderStat::new(
+                duration,
+                camera.image_height() * camera.image_width(),
+                samples_per_pixel,
+                &results.iter().map(|result| result.average_pixel_throughput).collect::<Vec<_>>()
+            )
         )
     }
 }
\ No newline at end of file